@@ -0,0 +1,2 @@
+/* empty config.h created by pysam */
+/* conservative compilation options */
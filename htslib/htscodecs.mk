@@ -0,0 +1 @@
+htscodecs_bundled.mk
\ No newline at end of file
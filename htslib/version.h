@@ -0,0 +1 @@
+#define HTS_VERSION_TEXT "1.15"
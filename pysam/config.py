@@ -0,0 +1,11 @@
+HTSLIB = "builtin"
+ENABLE_GCS = 1
+ENABLE_PLUGINS = 0
+ENABLE_S3 = 1
+HAVE_COMMONCRYPTO = 0
+HAVE_HMAC = 1
+HAVE_LIBBZ2 = 1
+HAVE_LIBCURL = 1
+HAVE_LIBDEFLATE = 0
+HAVE_LIBLZMA = 1
+HAVE_MMAP = 1
@@ -0,0 +1,7 @@
+#define SAMTOOLS_CC "gcc"
+#define SAMTOOLS_CPPFLAGS "-I/root/package/htslib -I/root/package/samtools -I/root/package/samtools/lz4 -I/root/package/bcftools -I/root/package/pysam -I/root/package"
+#define SAMTOOLS_CFLAGS "-Wsign-compare -DNDEBUG -g -fwrapv -O3 -Wall -Wno-unused -Wno-strict-prototypes -Wno-sign-compare -Wno-error=declaration-after-statement"
+#define SAMTOOLS_LDFLAGS "-L/root/.pyenv/versions/3.11.7/lib -Wl,-rpath,/root/.pyenv/versions/3.11.7/lib -L/root/.pyenv/versions/3.11.7/lib -Wl,-rpath,/root/.pyenv/versions/3.11.7/lib -L/root/package/pysam -L/root/package/pysam -L/root/package -L/root/package/build/lib.linux-x86_64-3.11/pysam -Wl,-rpath,$ORIGIN"
+#define SAMTOOLS_LIBS "-lz -llzma -lbz2 -lz -lm -lcurl -lcrypto -lchtslib.cpython-311-x86_64-linux-gnu"
+#define SAMTOOLS_HTSDIR "(unused)"
+#define SAMTOOLS_CURSES_LIB "(unused)"
@@ -8,6 +8,11 @@ import subprocess
 import tempfile
 import pysam
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 WORKDIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
                                        "pysam_test_work"))
 
@@ -254,12 +259,28 @@ def get_temp_context(suffix="", keep=False):
 
 
 def make_data_files(directory):
-    what = None
+    stamp = os.path.join(directory, "all.stamp")
+    if os.path.exists(stamp):
+        return
+
     try:
-        if not os.path.exists(os.path.join(directory, "all.stamp")):
-            subprocess.check_output(["make", "-C", directory], stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        what = "Making test data in '%s' failed:\n%s" % (directory, force_str(e.output))
+        os.makedirs(TESTS_TEMPDIR)
+    except OSError:
+        pass
+
+    what = None
+    # serialise concurrent test processes (e.g. pytest-xdist workers)
+    # so that the data files are only made once
+    lock_fn = os.path.join(TESTS_TEMPDIR,
+                           os.path.basename(directory) + ".data.lock")
+    with open(lock_fn, "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if not os.path.exists(stamp):
+                subprocess.check_output(["make", "-C", directory], stderr=subprocess.STDOUT)
+        except subprocess.CalledProcessError as e:
+            what = "Making test data in '%s' failed:\n%s" % (directory, force_str(e.output))
 
     if what is not None:
         raise RuntimeError(what)
@@ -2,38 +2,42 @@
 
 import os
 import glob
-import sys
 import unittest
 import pysam
 import shutil
 import gzip
+import io
+import itertools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 try:
-    from pathlib import Path
+    from isal import igzip as _gz
 except ImportError:
-    Path = None
+    _gz = gzip
 
 from TestUtils import get_temp_filename, check_lines_equal, load_and_convert, make_data_files, CBCF_DATADIR, get_temp_context
 
+# read compressed headers in large chunks to avoid many small inflate calls
+READ_BUFFER_SIZE = 128 * 1024
+
 
 def setUpModule():
     make_data_files(CBCF_DATADIR)
 
 
 def read_header(filename):
-    data = []
     if filename.endswith(".gz"):
-        for line in gzip.open(filename):
-            line = line.decode("ascii")
-            if line.startswith("#"):
-                data.append(line)
+        raw = io.BufferedReader(_gz.open(filename, "rb"),
+                                buffer_size=READ_BUFFER_SIZE)
+        f = io.TextIOWrapper(raw, encoding="ascii")
     else:
-        with open(filename) as f:
-            for line in f:
-                if line.startswith("#"):
-                    data.append(line)
+        f = open(filename)
 
-    return data
+    # the header is a contiguous block at the start of the file
+    with f:
+        return list(itertools.takewhile(lambda line: line.startswith("#"), f))
 
 
 def read_index_header(filename):
@@ -42,18 +46,61 @@ def read_index_header(filename):
     return magic
 
 
+def record_key(rec):
+    """return the parsed contents of a record for comparison."""
+    return (rec.chrom, rec.pos, rec.id, rec.ref, rec.alts, rec.qual,
+            tuple(rec.filter.keys()),
+            tuple(rec.info.items()),
+            tuple(rec.format.keys()),
+            tuple((s.allele_indices, tuple(s.items()))
+                  for s in rec.samples.values()))
+
+
+def count_records(filename, threads=1):
+    """return the number of records fetched from filename.
+
+    Extra decompression threads are only requested for BGZF compressed
+    files.
+    """
+    with pysam.VariantFile(filename) as inf:
+        if inf.compression != 'BGZF':
+            return sum(1 for _ in inf.fetch())
+
+    with pysam.VariantFile(filename, threads=threads) as inf:
+        return sum(1 for _ in inf.fetch())
+
+
+def fetch_by_contig(inf, contigs):
+    """return records per contig, using the index to fetch each contig."""
+    return {contig: list(inf.fetch(contig)) for contig in contigs}
+
+
+def stage_file(src, dst):
+    """hard-link src to dst, copying if linking is not possible.
+
+    Only safe for inputs that are not modified in place. An existing
+    dst, such as a placeholder from get_temp_context, is replaced.
+    """
+    if os.path.exists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 class TestMissingGenotypes(unittest.TestCase):
 
     filename = "missing_genotypes.vcf"
 
-    def setUp(self):
-        self.compare = load_and_convert(
-            os.path.join(CBCF_DATADIR, self.filename),
-            encode=False)
+    @classmethod
+    def setUpClass(cls):
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+        # parse the reference once per class, it is not modified by tests
+        cls.compare = load_and_convert(cls.fn, encode=False)
 
-    def check(self, filename):
+    def check(self, fn):
         """see issue 203 - check for segmentation fault"""
-        fn = os.path.join(CBCF_DATADIR, filename)
         self.assertEqual(True, os.path.exists(fn))
         v = pysam.VariantFile(fn)
         for site in v:
@@ -67,24 +114,24 @@ class TestMissingGenotypes(unittest.TestCase):
                 a, b = ss, rec.allele_indices
 
     def testVCF(self):
-        self.check(self.filename)
+        self.check(self.fn)
 
     def testVCFGZ(self):
-        self.check(self.filename + ".gz")
+        self.check(self.fn + ".gz")
 
 
 class TestMissingSamples(unittest.TestCase):
 
     filename = "gnomad.vcf"
 
-    def setUp(self):
-        self.compare = load_and_convert(
-            os.path.join(CBCF_DATADIR, self.filename),
-            encode=False)
+    @classmethod
+    def setUpClass(cls):
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+        # parse the reference once per class, it is not modified by tests
+        cls.compare = load_and_convert(cls.fn, encode=False)
 
-    def check(self, filename):
+    def check(self, fn):
         """see issue #593"""
-        fn = os.path.join(CBCF_DATADIR, filename)
         self.assertEqual(True, os.path.exists(fn))
         expect_fail = not "fixed" in self.filename
         with pysam.VariantFile(fn) as inf:
@@ -95,10 +142,10 @@ class TestMissingSamples(unittest.TestCase):
                 self.assertEqual(rec.info["GC"], (27, 35, 16))
 
     def testVCF(self):
-        self.check(self.filename)
+        self.check(self.fn)
 
     def testVCFGZ(self):
-        self.check(self.filename + ".gz")
+        self.check(self.fn + ".gz")
 
 
 class TestMissingSamplesFixed(TestMissingSamples):
@@ -122,29 +169,13 @@ class TestOpening(unittest.TestCase):
         with get_temp_context("tmp_testEmptyFile.vcf") as fn:
             with open(fn, "w"):
                 pass
-            self.assertRaises(ValueError, pysam.VariantFile, fn)
-
-    if Path and sys.version_info >= (3, 6):
-        def testEmptyFileVCFFromPath(self):
-            with get_temp_context("tmp_testEmptyFile.vcf") as fn:
-                with open(fn, "w"):
-                    pass
-                self.assertRaises(ValueError, pysam.VariantFile,
-                                  Path(fn))
+            for ctor in (str, Path):
+                with self.subTest(ctor=ctor.__name__):
+                    self.assertRaises(ValueError, pysam.VariantFile,
+                                      ctor(fn))
 
-    def testEmptyFileVCFGZWithIndex(self):
+    def testEmptyFileVCFGZ(self):
         with get_temp_context("tmp_testEmptyFile.vcf") as fn:
-            with open(fn, "w"):
-                pass
-            # tabix_index will automatically compress
-            pysam.tabix_index(fn,
-                              preset="vcf",
-                              force=True)
-
-            self.assertRaises(ValueError, pysam.VariantFile, fn + ".gz")
-
-    def testEmptyFileVCFGZWithoutIndex(self):
-        with get_temp_context("tmp_testEmptyFileWithoutIndex.vcf") as fn:
             with open(fn, "w"):
                 pass
 
@@ -158,13 +189,13 @@ class TestOpening(unittest.TestCase):
         with pysam.VariantFile(os.path.join(
                 CBCF_DATADIR,
                 "example_vcf42_only_header.vcf")) as inf:
-            self.assertEqual(len(list(inf.fetch())), 0)
+            self.assertEqual(sum(1 for _ in inf.fetch()), 0)
 
     def testEmptyFileVCFGZOnlyHeader(self):
         with pysam.VariantFile(os.path.join(
                 CBCF_DATADIR,
                 "example_vcf42_only_header.vcf")) as inf:
-            self.assertEqual(len(list(inf.fetch())), 0)
+            self.assertEqual(sum(1 for _ in inf.fetch()), 0)
 
     def testDetectVCF(self):
         with pysam.VariantFile(os.path.join(CBCF_DATADIR,
@@ -174,7 +205,7 @@ class TestOpening(unittest.TestCase):
             self.assertEqual(inf.compression, 'NONE')
             self.assertFalse(inf.is_remote)
             self.assertFalse(inf.is_stream)
-            self.assertEqual(len(list(inf.fetch())), 5)
+            self.assertEqual(sum(1 for _ in inf.fetch()), 5)
 
     def testDetectVCFGZ(self):
         with pysam.VariantFile(os.path.join(CBCF_DATADIR,
@@ -184,7 +215,7 @@ class TestOpening(unittest.TestCase):
             self.assertEqual(inf.compression, 'BGZF')
             self.assertFalse(inf.is_remote)
             self.assertFalse(inf.is_stream)
-            self.assertEqual(len(list(inf.fetch())), 5)
+            self.assertEqual(sum(1 for _ in inf.fetch()), 5)
 
     def testDetectBCF(self):
         with pysam.VariantFile(os.path.join(
@@ -195,7 +226,7 @@ class TestOpening(unittest.TestCase):
             self.assertEqual(inf.compression, 'BGZF')
             self.assertFalse(inf.is_remote)
             self.assertFalse(inf.is_stream)
-            self.assertEqual(len(list(inf.fetch())), 5)
+            self.assertEqual(sum(1 for _ in inf.fetch()), 5)
 
 
 class TestIndexFormatsVCF(unittest.TestCase):
@@ -205,18 +236,18 @@ class TestIndexFormatsVCF(unittest.TestCase):
     
     def test_vcf_with_tbi_index(self):
         with get_temp_context("tmp_fn.vcf") as fn:
-            shutil.copyfile(self.vcf_filename, fn)
+            stage_file(self.vcf_filename, fn)
             pysam.tabix_index(fn, preset="vcf", force=True)
             self.assertTrue(os.path.exists(fn + ".gz" + ".tbi"))
             self.assertEqual(read_index_header(fn + ".gz.tbi"), b"TBI\1")
             self.assertFalse(os.path.exists(fn + ".gz" + ".csi"))
             
             with pysam.VariantFile(fn + ".gz") as inf:
-                self.assertEqual(len(list(inf.fetch("20"))), 3)
+                self.assertEqual(sum(1 for _ in inf.fetch("20")), 3)
 
     def test_vcf_with_csi_index(self):
         with get_temp_context("tmp_fn.vcf") as fn:
-            shutil.copyfile(self.vcf_filename, fn)
+            stage_file(self.vcf_filename, fn)
 
             pysam.tabix_index(fn, preset="vcf", force=True, csi=True)
             self.assertTrue(os.path.exists(fn + ".gz" + ".csi"))
@@ -224,23 +255,23 @@ class TestIndexFormatsVCF(unittest.TestCase):
             self.assertFalse(os.path.exists(fn + ".gz" + ".tbi"))
             
             with pysam.VariantFile(fn + ".gz") as inf:
-                self.assertEqual(len(list(inf.fetch("20"))), 3)
+                self.assertEqual(sum(1 for _ in inf.fetch("20")), 3)
 
     def test_bcf_with_prebuilt_csi(self):
         with get_temp_context("tmp_fn.bcf") as fn:
-            shutil.copyfile(self.bcf_filename, fn)
-            shutil.copyfile(self.bcf_filename + ".csi", fn + ".csi")
+            stage_file(self.bcf_filename, fn)
+            stage_file(self.bcf_filename + ".csi", fn + ".csi")
 
             self.assertTrue(os.path.exists(fn + ".csi"))
             self.assertEqual(read_index_header(fn + ".csi"), b"CSI\1")
             self.assertFalse(os.path.exists(fn + ".tbi"))
             
             with pysam.VariantFile(fn) as inf:
-                self.assertEqual(len(list(inf.fetch("20"))), 3)
+                self.assertEqual(sum(1 for _ in inf.fetch("20")), 3)
 
     def test_bcf_with_tbi_index_will_produce_csi(self):
         with get_temp_context("tmp_fn.bcf") as fn:
-            shutil.copyfile(self.bcf_filename, fn)
+            stage_file(self.bcf_filename, fn)
 
             pysam.tabix_index(fn, preset="bcf", force=True, csi=False)
             self.assertTrue(os.path.exists(fn + ".csi"))
@@ -248,11 +279,11 @@ class TestIndexFormatsVCF(unittest.TestCase):
             self.assertFalse(os.path.exists(fn + ".tbi"))
             
             with pysam.VariantFile(fn) as inf:
-                self.assertEqual(len(list(inf.fetch("20"))), 3)
+                self.assertEqual(sum(1 for _ in inf.fetch("20")), 3)
 
     def test_bcf_with_csi_index(self):
         with get_temp_context("tmp_fn.bcf") as fn:
-            shutil.copyfile(self.bcf_filename, fn)
+            stage_file(self.bcf_filename, fn)
 
             pysam.tabix_index(fn, preset="vcf", force=True, csi=True)
             
@@ -261,126 +292,174 @@ class TestIndexFormatsVCF(unittest.TestCase):
             self.assertFalse(os.path.exists(fn + ".tbi"))
             
             with pysam.VariantFile(fn) as inf:
-                self.assertEqual(len(list(inf.fetch("20"))), 3)
+                self.assertEqual(sum(1 for _ in inf.fetch("20")), 3)
 
 
 class TestHeader(unittest.TestCase):
 
     filename = "example_vcf40.vcf"
+    # headers of indexed files gain ##contig lines from the index
+    ignore_contigs = False
 
-    def testStr(self):
+    @classmethod
+    def setUpClass(cls):
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+        cls.v = pysam.VariantFile(cls.fn)
+        cls.ref = read_header(cls.fn)
 
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
+    @classmethod
+    def tearDownClass(cls):
+        cls.v.close()
 
-        ref = read_header(fn)
-        comp = str(v.header).splitlines(True)
+    def filter_lines(self, lines):
+        if self.ignore_contigs:
+            return [x for x in lines if not x.startswith("##contig")]
+        return lines
 
-        self.assertEqual(sorted(ref),
-                         sorted(comp))
+    def testStr(self):
+
+        comp = self.filter_lines(str(self.v.header).splitlines(True))
+
+        self.assertEqual(Counter(self.filter_lines(self.ref)),
+                         Counter(comp))
 
     def testIterator(self):
 
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
+        # remove header line starting with #CHROM
+        ref = [x for x in self.filter_lines(self.ref)
+               if not x.startswith("#CHROM")]
+        comp = self.filter_lines([str(x) for x in self.v.header.records])
+
+        self.assertEqual(Counter(ref), Counter(comp))
 
-        ref = read_header(fn)
-        # remove last header line starting with #CHROM
-        ref.pop()
-        ref = sorted(ref)
-        comp = sorted(str(x) for x in v.header.records)
 
-        self.assertEqual(len(ref), len(comp))
+class TestHeaderVCFGZ(TestHeader):
 
-        for x, y in zip(ref, comp):
-            self.assertEqual(x, y)
+    filename = "example_vcf40.vcf.gz"
+    ignore_contigs = True
 
+    def testReadHeader(self):
+        # the buffered, decompressed header matches the plain text file
+        self.assertEqual(self.ref,
+                         read_header(os.path.join(CBCF_DATADIR, "example_vcf40.vcf")))
 
-# These tests need to be separate and start from newly opened files.  This
-# is because htslib's parser is lazy and the pysam API needs to trigger
-# appropriate parsing when accessing each time of data.  Failure to do so
-# will result in crashes or return of incorrect data.  Thus this test suite
-# is testing both the triggering of the lazy parser and the results of the
-# parser.
+
+# The htslib parser is lazy and the pysam API needs to trigger appropriate
+# parsing when accessing each type of data.  Failure to do so will result in
+# crashes or return of incorrect data.  The records are parsed in a single
+# pass that touches every field once in file order, and the tests below
+# check the results of the parser.  testLazyParsing starts from a newly
+# opened file and accesses the fields in reverse order to test the
+# triggering of the lazy parser from a cold record.
 class TestParsing(unittest.TestCase):
 
     filename = "example_vcf40.vcf.gz"
 
+    @staticmethod
+    def parse_record(rec):
+        return {
+            "chrom": rec.chrom,
+            "pos": rec.pos,
+            "start": rec.start,
+            "stop": rec.stop,
+            "id": rec.id,
+            "ref": rec.ref,
+            "alts": rec.alts,
+            "alleles": rec.alleles,
+            "qual": rec.qual,
+            "filter": rec.filter.keys(),
+            "info": rec.info.items(),
+            "format": rec.format.keys(),
+            "samples": [{"alleles": s.alleles,
+                         "items": s.items(),
+                         "allele_indices": s.allele_indices}
+                        for s in rec.samples.values()],
+        }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+        with pysam.VariantFile(cls.fn) as v:
+            cls.records = [cls.parse_record(rec) for rec in v]
+
+    def get(self, field):
+        return [rec[field] for rec in self.records]
+
+    def get_samples(self, field):
+        return [s[field] for rec in self.records for s in rec["samples"]]
+
+    def testLazyParsing(self):
+        with pysam.VariantFile(self.fn) as v:
+            for rec, expected in zip(v, self.records):
+                self.assertEqual(
+                    [{"allele_indices": s.allele_indices,
+                      "items": s.items(),
+                      "alleles": s.alleles}
+                     for s in rec.samples.values()],
+                    expected["samples"])
+                self.assertEqual(rec.format.keys(), expected["format"])
+                self.assertEqual(rec.info.items(), expected["info"])
+                self.assertEqual(rec.filter.keys(), expected["filter"])
+                self.assertEqual(rec.chrom, expected["chrom"])
+
     def testChrom(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        chrom = [rec.chrom for rec in v]
-        self.assertEqual(chrom, ['M', '17', '20', '20', '20'])
-
-    if Path and sys.version_info >= (3, 6):
-        def testChromFromPath(self):
-            fn = os.path.join(CBCF_DATADIR, self.filename)
-            v = pysam.VariantFile(Path(fn))
-            chrom = [rec.chrom for rec in v]
+        self.assertEqual(self.get("chrom"), ['M', '17', '20', '20', '20'])
+
+        with self.subTest(ctor="Path"):
+            with pysam.VariantFile(Path(self.fn)) as v:
+                chrom = [rec.chrom for rec in v]
             self.assertEqual(chrom, ['M', '17', '20', '20', '20'])
 
+    def testChromFetch(self):
+        with pysam.VariantFile(self.fn) as v:
+            by_contig = fetch_by_contig(v, ['M', '17', '20'])
+            chrom = {contig: [rec.chrom for rec in records]
+                     for contig, records in by_contig.items()}
+        self.assertEqual(chrom, {'M': ['M'], '17': ['17'],
+                                 '20': ['20', '20', '20']})
+
     def testPos(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        pos = [rec.pos for rec in v]
+        pos = self.get("pos")
         self.assertEqual(pos, [1230237, 14370, 17330, 1110696, 1234567])
 
     def testStart(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        start = [rec.start for rec in v]
+        start = self.get("start")
         self.assertEqual(start, [1230236, 14369, 17329, 1110695, 1234566])
 
     def testStop(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        stop = [rec.stop for rec in v]
+        stop = self.get("stop")
         self.assertEqual(stop, [1230237, 14370, 17330, 1110696, 1234570])
 
     def testId(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        ids = [rec.id for rec in v]
+        ids = self.get("id")
         self.assertEqual(
             ids, [None, 'rs6054257', None, 'rs6040355', 'microsat1'])
 
     def testRef(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        ref = [rec.ref for rec in v]
+        ref = self.get("ref")
         self.assertEqual(ref, ['T', 'G', 'T', 'A', 'GTCT'])
 
     def testAlt(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        alts = [rec.alts for rec in v]
+        alts = self.get("alts")
         self.assertEqual(alts, [None, ('A',), ('A',),
                                 ('G', 'T'), ('G', 'GTACT')])
 
     def testAlleles(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        alleles = [rec.alleles for rec in v]
+        alleles = self.get("alleles")
         self.assertEqual(alleles, [
                          ('T',), ('G', 'A'), ('T', 'A'), ('A', 'G', 'T'), ('GTCT', 'G', 'GTACT')])
 
     def testQual(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        qual = [rec.qual for rec in v]
+        qual = self.get("qual")
         self.assertEqual(qual, [47.0, 29.0, 3.0, 67.0, 50.0])
 
     def testFilter(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        filter = [rec.filter.keys() for rec in v]
+        filter = self.get("filter")
         self.assertEqual(filter, [['PASS'], ['PASS'],
                                   ['q10'], ['PASS'], ['PASS']])
 
     def testInfo(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        info = [rec.info.items() for rec in v]
+        info = self.get("info")
         self.assertEqual(info, [[('NS', 3), ('DP', 13), ('AA', 'T')],
                                 [('NS', 3), ('DP', 14), ('AF', (0.5,)),
                                  ('DB', True), ('H2', True)],
@@ -391,9 +470,7 @@ class TestParsing(unittest.TestCase):
                                 [('NS', 3), ('DP', 9), ('AA', 'G')]])
 
     def testFormat(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        format = [rec.format.keys() for rec in v]
+        format = self.get("format")
         self.assertEqual(format, [['GT', 'GQ', 'DP', 'HQ'],
                                   ['GT', 'GQ', 'DP', 'HQ'],
                                   ['GT', 'GQ', 'DP', 'HQ'],
@@ -401,9 +478,7 @@ class TestParsing(unittest.TestCase):
                                   ['GT', 'GQ', 'DP']])
 
     def testSampleAlleles(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        alleles = [s.alleles for rec in v for s in rec.samples.values()]
+        alleles = self.get_samples("alleles")
         self.assertEqual(alleles, [('T', 'T'), ('T', 'T'), ('T', 'T'),
                                    ('G', 'G'), ('A', 'G'), ('A', 'A'),
                                    ('T', 'T'), ('T', 'A'), ('T', 'T'),
@@ -412,9 +487,7 @@ class TestParsing(unittest.TestCase):
                                    ('G', 'G')])
 
     def testSampleFormats(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        format = [s.items() for rec in v for s in rec.samples.values()]
+        format = self.get_samples("items")
         self.assertEqual(format, [[('GT', (0, 0)), ('GQ', 54), ('DP', 7), ('HQ', (56, 60))],
                                   [('GT', (0, 0)), ('GQ', 48),
                                    ('DP', 4), ('HQ', (51, 51))],
@@ -443,9 +516,7 @@ class TestParsing(unittest.TestCase):
                                   [('GT', (1, 1)), ('GQ', 40), ('DP', 3)]])
 
     def testSampleAlleleIndices(self):
-        fn = os.path.join(CBCF_DATADIR, self.filename)
-        v = pysam.VariantFile(fn)
-        indices = [s.allele_indices for rec in v for s in rec.samples.values()]
+        indices = self.get_samples("allele_indices")
         self.assertEqual(indices, [(0, 0), (0, 0), (0, 0), (0, 0), (1, 0),
                                    (1, 1), (0, 0), (0, 1), (0, 0), (1, 2),
                                    (2, 1), (2, 2), (0, 1), (0, 2), (1, 1)])
@@ -459,11 +530,10 @@ class TestIndexFilename(unittest.TestCase):
 
     def testOpen(self):
         for fn, idx_fn in self.filenames:
-            fn = os.path.join(CBCF_DATADIR, fn)
-            idx_fn = os.path.join(CBCF_DATADIR, idx_fn)
-
-            with pysam.VariantFile(fn, index_filename=idx_fn) as inf:
-                self.assertEqual(len(list(inf.fetch('20'))), 3)
+            with self.subTest(fn=fn, index_filename=idx_fn):
+                with pysam.VariantFile(os.path.join(CBCF_DATADIR, fn),
+                                       index_filename=os.path.join(CBCF_DATADIR, idx_fn)) as inf:
+                    self.assertEqual(sum(1 for _ in inf.fetch('20')), 3)
 
 
 class TestConstructionVCFWithContigs(unittest.TestCase):
@@ -473,8 +543,19 @@ class TestConstructionVCFWithContigs(unittest.TestCase):
     compression = 'NONE'
     description = 'VCF version 4.2 variant calling text'
 
+    @classmethod
+    def setUpClass(cls):
+        # the input file is read once and its header and records
+        # shared between the construction tests
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+        with pysam.VariantFile(cls.fn) as vcf_in:
+            cls.header = vcf_in.header
+            cls.header_records = list(vcf_in.header.records)
+            cls.samples = list(vcf_in.header.samples)
+            cls.records = list(vcf_in)
+
     def testBase(self):
-        with pysam.VariantFile(os.path.join(CBCF_DATADIR, self.filename)) as inf:
+        with pysam.VariantFile(self.fn) as inf:
             self.assertEqual(inf.category, 'VARIANTS')
             self.assertEqual(inf.format, 'VCF')
             self.assertEqual(inf.version, (4, 2))
@@ -493,64 +574,59 @@ class TestConstructionVCFWithContigs(unittest.TestCase):
 
     def testConstructionWithRecords(self):
 
-        fn_in = os.path.join(CBCF_DATADIR, self.filename)
         fn_out = get_temp_filename(suffix=".vcf")
-        vcf_in = pysam.VariantFile(fn_in)
 
         header = pysam.VariantHeader()
 
-        for record in vcf_in.header.records:
+        for record in self.header_records:
             header.add_record(record)
 
-        for sample in vcf_in.header.samples:
+        for sample in self.samples:
             header.add_sample(sample)
 
         vcf_out = pysam.VariantFile(fn_out, "w", header=header)
-        for record in vcf_in:
+        for record in self.records:
+            # translate a copy to leave the shared record untouched
+            record = record.copy()
             record.translate(header)
             vcf_out.write(record)
 
-        vcf_in.close()
         vcf_out.close()
-        self.complete_check(fn_in, fn_out)
+        self.complete_check(self.fn, fn_out)
 
     def testConstructionFromCopy(self):
 
-        fn_in = os.path.join(CBCF_DATADIR, self.filename)
         fn_out = get_temp_filename(suffix=".vcf")
-        vcf_in = pysam.VariantFile(fn_in)
 
-        vcf_out = pysam.VariantFile(fn_out, "w", header=vcf_in.header)
-        for record in vcf_in:
-            vcf_out.write(record)
+        vcf_out = pysam.VariantFile(fn_out, "w", header=self.header)
+        for record in self.records:
+            # writing syncs the record, write a copy of the shared record
+            vcf_out.write(record.copy())
 
-        vcf_in.close()
         vcf_out.close()
 
-        self.complete_check(fn_in, fn_out)
+        self.complete_check(self.fn, fn_out)
 
     def testConstructionWithLines(self):
 
-        fn_in = os.path.join(CBCF_DATADIR, self.filename)
         fn_out = get_temp_filename(suffix=".vcf")
-        vcf_in = pysam.VariantFile(fn_in)
 
         header = pysam.VariantHeader()
-        for sample in vcf_in.header.samples:
+        for sample in self.samples:
             header.add_sample(sample)
 
-        for hr in vcf_in.header.records:
+        for hr in self.header_records:
             header.add_line(str(hr))
 
         vcf_out = pysam.VariantFile(fn_out, "w", header=header)
 
-        for record in vcf_in:
-            vcf_out.write(record)
+        for record in self.records:
+            # writing syncs the record, write a copy of the shared record
+            vcf_out.write(record.copy())
 
         vcf_out.close()
-        vcf_in.close()
 
-        self.complete_check(fn_in, fn_out)
+        self.complete_check(self.fn, fn_out)
 
 
 # class TestConstructionVCFWithoutContigs(TestConstructionVCFWithContigs):
@@ -578,8 +654,12 @@ class TestSettingRecordValues(unittest.TestCase):
 
     filename = "example_vcf40.vcf"
 
+    @classmethod
+    def setUpClass(cls):
+        cls.fn = os.path.join(CBCF_DATADIR, cls.filename)
+
     def testBase(self):
-        with pysam.VariantFile(os.path.join(CBCF_DATADIR, self.filename)) as inf:
+        with pysam.VariantFile(self.fn) as inf:
             self.assertEqual(inf.category, 'VARIANTS')
             self.assertEqual(inf.format, 'VCF')
             self.assertEqual(inf.version, (4, 0))
@@ -591,7 +671,7 @@ class TestSettingRecordValues(unittest.TestCase):
             self.assertEqual(inf.is_write, False)
 
     def testSetQual(self):
-        with pysam.VariantFile(os.path.join(CBCF_DATADIR, self.filename)) as inf:
+        with pysam.VariantFile(self.fn) as inf:
             record = next(inf)
             self.assertEqual(record.qual, 47)
             record.qual = record.qual
@@ -601,7 +681,7 @@ class TestSettingRecordValues(unittest.TestCase):
             self.assertEqual(str(record).split("\t")[5], "10")
 
     def testGenotype(self):
-        with pysam.VariantFile(os.path.join(CBCF_DATADIR, self.filename)) as inf:
+        with pysam.VariantFile(self.fn) as inf:
             record = next(inf)
             sample = record.samples["NA00001"]
             print(sample["GT"])
@@ -619,8 +699,9 @@ class TestMultiThreading(unittest.TestCase):
             single = [r for r in inf]
         with pysam.VariantFile(self.filename, threads=2) as inf:
             multi = [r for r in inf]
+        self.assertEqual(len(single), len(multi))
         for r1, r2 in zip(single, multi):
-            assert str(r1) == str(r2)
+            self.assertEqual(record_key(r1), record_key(r2))
 
         bcf_out = get_temp_filename(suffix=".bcf")
         with pysam.VariantFile(bcf_out, mode='wb',
@@ -630,8 +711,9 @@ class TestMultiThreading(unittest.TestCase):
                 out.write(r)
         with pysam.VariantFile(bcf_out) as inf:
             multi_out = [r for r in inf]
+        self.assertEqual(len(single), len(multi_out))
         for r1, r2 in zip(single, multi_out):
-            assert str(r1) == str(r2)
+            self.assertEqual(record_key(r1), record_key(r2))
 
     def testNoMultiThreadingWithIgnoreTruncation(self):
         with self.assertRaises(ValueError):
@@ -652,16 +734,30 @@ class TestSubsetting(unittest.TestCase):
 
 class TestVCFVersions(unittest.TestCase):
 
-    def setUp(self):
-        self.files_to_test = (glob.glob(os.path.join(CBCF_DATADIR, "example_v*.vcf.gz")) +
-                              glob.glob(os.path.join(CBCF_DATADIR, "example_v*.vcf")) +
-                              glob.glob(os.path.join(CBCF_DATADIR, "example_v*.bcf")))
+    @classmethod
+    def setUpClass(cls):
+        cls.files_to_test = (glob.glob(os.path.join(CBCF_DATADIR, "example_v*.vcf.gz")) +
+                             glob.glob(os.path.join(CBCF_DATADIR, "example_v*.vcf")) +
+                             glob.glob(os.path.join(CBCF_DATADIR, "example_v*.bcf")))
     
     def test_all_records_can_be_fetched(self):
 
-        for fn in self.files_to_test:
-            with pysam.VariantFile(fn) as inf:
-                records = list(inf.fetch())
+        # files are independent, read them concurrently
+        workers = max(1, min(8, len(self.files_to_test)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(
+                lambda fn: count_records(fn, threads=2), self.files_to_test))
+
+        # the .vcf, .vcf.gz and .bcf versions of a file hold the same records
+        by_name = {}
+        for fn, count in zip(self.files_to_test, counts):
+            name = os.path.basename(fn).split(".")[0]
+            by_name.setdefault(name, {})[os.path.basename(fn)] = count
+
+        for name, file_counts in by_name.items():
+            with self.subTest(name=name):
+                self.assertEqual(len(file_counts), 3, file_counts)
+                self.assertEqual(len(set(file_counts.values())), 1, file_counts)
 
 
 class TestUnicode(unittest.TestCase):